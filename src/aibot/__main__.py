@@ -1,11 +1,17 @@
 """Entry point: run the bot with `python -m src.aibot`."""
 
+import asyncio
 import os
 
 from dotenv import load_dotenv
 
 from src.aibot.discord.client import BotClient
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
 
 def main() -> None:
     """Start the Discord bot using the DISCORD_TOKEN environment variable."""
@@ -14,6 +20,10 @@ def main() -> None:
     if not token:
         msg = "環境変数 DISCORD_TOKEN を設定してね（.env でも可）"
         raise SystemExit(msg)
+    if uvloop is not None:
+        # discord.py runs on whichever loop `asyncio.run` creates, so install the
+        # policy before `Client.run` builds it.
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     BotClient.get_instance().run(token)
 
 
@@ -2,7 +2,9 @@
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any
 
+from sqlalchemy import Connection, event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -14,14 +16,62 @@ from src.aibot.db.base import Base
 
 _DATABASE_URL = "sqlite+aiosqlite:///aibot.db"
 
+# Applied to every new DBAPI connection. WAL lets readers proceed while a write
+# is in progress. With synchronous=NORMAL in WAL mode a commit is not fsynced;
+# the WAL is synced only at checkpoints. That is durable across application
+# crashes, but the last commits can be lost on power failure or an OS crash.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA journal_size_limit=67108864",  # shrink the WAL back to 64 MiB after checkpoints
+)
+
 engine = create_async_engine(_DATABASE_URL)
 session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
 
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: object) -> None:  # noqa: ANN401
+    in_memory = engine.url.database in (None, "", ":memory:")
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            if in_memory and pragma.startswith("PRAGMA journal_mode"):
+                continue
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _create_schema(conn: Connection) -> None:
+    Base.metadata.create_all(conn)
+    # `create_all` only builds indexes together with new tables; also add
+    # indexes introduced after a table was first created.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 async def init_db() -> None:
-    """Create all tables if they do not already exist."""
+    """Create all tables and indexes that do not already exist."""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_schema)
+
+
+async def optimize_db() -> None:
+    """Refresh query-planner statistics and fold the WAL back into the database."""
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA optimize")
+        await conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+async def close_db() -> None:
+    """Close every pooled connection (call once on shutdown)."""
+    await engine.dispose()
 
 
 @asynccontextmanager
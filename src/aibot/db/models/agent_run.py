@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, Integer, String
+from sqlalchemy import CheckConstraint, DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.aibot.db.base import Base
@@ -22,6 +22,8 @@ class AgentRun(Base):
             "status IN ('succeeded', 'failed')",
             name="ck_agent_runs_status",
         ),
+        # Serves `get_recent_for_session` (filter by session, newest id first).
+        Index("ix_agent_runs_session_id_id", "session_id", "id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
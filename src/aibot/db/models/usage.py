@@ -2,7 +2,7 @@
 
 from datetime import date, datetime
 
-from sqlalchemy import BigInteger, Date, DateTime, Integer, UniqueConstraint
+from sqlalchemy import BigInteger, Date, DateTime, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.aibot.db.base import Base
@@ -30,7 +30,11 @@ class DailyTokenUsage(Base):
     """
 
     __tablename__ = "daily_token_usage"
-    __table_args__ = (UniqueConstraint("user_id", "usage_date", name="uq_daily_usage_user_date"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "usage_date", name="uq_daily_usage_user_date"),
+        # Serves `reset_old_usage` (range delete on `usage_date`).
+        Index("ix_daily_token_usage_usage_date", "usage_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(BigInteger)
@@ -0,0 +1,14 @@
+"""Bot-wide admin users, configured via the `ADMIN_USER_IDS` env var."""
+
+import os
+from functools import cache
+
+
+@cache
+def admin_user_ids() -> frozenset[int]:
+    """Parse the admin user IDs from `ADMIN_USER_IDS` (comma-separated).
+
+    Parsed on first use and cached, since admin checks run on every gated
+    command. Raises `KeyError` while the variable is unset.
+    """
+    return frozenset(int(i) for i in os.environ["ADMIN_USER_IDS"].split(","))
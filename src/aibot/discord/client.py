@@ -1,8 +1,12 @@
 """The Discord bot client (singleton)."""
 
 import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
 
-from src.aibot.db.engine import get_session, init_db
+from src.aibot.db.engine import close_db, get_session, init_db
 from src.aibot.discord import AllowedMentions, Client, Guild, Intents, Messageable, app_commands
 from src.aibot.discord.guild_guard import (
     GuildGuardCommandTree,
@@ -10,17 +14,21 @@ from src.aibot.discord.guild_guard import (
     is_guild_allowed,
 )
 from src.aibot.logger import logger
+from src.aibot.services import agent_run_writer
 from src.aibot.services import reminder as reminder_service
 from src.aibot.services.scheduler import Scheduler
 
 intents = Intents.default()
 intents.members = True
 
+# Digest of the command payload from the last successful sync.
+_COMMAND_HASH_PATH = Path(".command_tree_hash")
+
 
 class BotClient(Client):
     """A singleton bot client class."""
 
-    _instance: "BotClient"
+    _instance: "BotClient | None" = None
     tree: app_commands.CommandTree
 
     def __init__(self) -> None:
@@ -29,11 +37,12 @@ class BotClient(Client):
         self.scheduler = Scheduler(on_fire=self._fire_reminder)
         self._restored = False
         self._reset_task: asyncio.Task[None] | None = None
+        self._run_writer_task: asyncio.Task[None] | None = None
 
     @classmethod
     def get_instance(cls) -> "BotClient":
         """Get the singleton instance of the bot client."""
-        if not hasattr(cls, "_instance"):
+        if cls._instance is None:
             cls._instance = cls()
         return cls._instance
 
@@ -43,12 +52,51 @@ class BotClient(Client):
         # every slash command on the command tree before we sync it.
         from src.aibot.discord import commands  # noqa: F401, PLC0415
 
-        await init_db()
         logger.debug(
             "Registered slash commands: %s",
             [cmd.name for cmd in self.tree.get_commands()],
         )
+        # Schema creation and the command sync REST call are independent, so
+        # overlap them instead of paying for both round-trips in sequence.
+        await asyncio.gather(init_db(), self._sync_commands_if_changed())
+
+    async def _sync_commands_if_changed(self) -> None:
+        """Sync the command tree only when it differs from the last synced one.
+
+        `tree.sync()` is a rate-limited REST call, so warm restarts with an
+        unchanged command set skip it. Set `FORCE_SYNC=1` to always sync.
+        """
+        payload = {
+            "application_id": self.application_id,
+            "commands": [cmd.to_dict(self.tree) for cmd in self.tree.get_commands()],
+        }
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode(),
+        ).hexdigest()
+        # File I/O runs in a thread so it does not stall `init_db()`, which is
+        # gathered alongside this coroutine.
+        try:
+            previous = await asyncio.to_thread(_COMMAND_HASH_PATH.read_text, encoding="utf-8")
+        except FileNotFoundError:
+            previous = None
+
+        if previous is not None and previous.strip() == digest and os.getenv("FORCE_SYNC") != "1":
+            logger.info("Slash commands unchanged since last sync; skipping sync")
+            return
+
         await self.tree.sync()
+        await asyncio.to_thread(_COMMAND_HASH_PATH.write_text, digest, encoding="utf-8")
+
+    async def close(self) -> None:
+        """Close the gateway connection, flush pending run logs, then release the DB pool."""
+        await super().close()
+        if self._run_writer_task is not None:
+            # Stop via the queue rather than cancel(), so a batch that is being
+            # written when shutdown starts is not interrupted.
+            agent_run_writer.stop()
+            await self._run_writer_task
+        await agent_run_writer.flush()
+        await close_db()
 
     async def on_ready(self) -> None:
         """Event handler called when the bot is ready."""
@@ -60,6 +108,7 @@ class BotClient(Client):
 
             await startup.restore_reminders(self)
             self._reset_task = asyncio.create_task(run_daily_reset_loop())
+            self._run_writer_task = asyncio.create_task(agent_run_writer.run_writer_loop())
             self._restored = True
 
     async def on_guild_join(self, guild: Guild) -> None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import time
 import uuid
+from functools import cache
 
 from src.aibot.db.engine import get_session
 from src.aibot.discord import Interaction, app_commands
@@ -15,6 +16,7 @@ from src.aibot.discord.decorators.usage import (
     track_token_usage,
 )
 from src.aibot.logger import logger
+from src.aibot.services import agent_run_writer
 from src.aibot.services import agent_runs as agent_runs_service
 from src.aibot.services.agents import generate_agents_response
 
@@ -24,8 +26,12 @@ client = BotClient.get_instance()
 DISCORD_MAX_CHARS = 2000
 
 
+@cache
 def _resolve_chunk_limit() -> int:
-    """Resolve the per-message character limit, capped at Discord's 2000."""
+    """Resolve the per-message character limit, capped at Discord's 2000.
+
+    The environment does not change at runtime, so the value is resolved once.
+    """
     raw = os.getenv("MAX_CHARS_PER_MESSAGE")
     if raw is None:
         return DISCORD_MAX_CHARS
@@ -62,14 +68,17 @@ async def _send_chunked(interaction: Interaction, text: str) -> None:
 
 
 def _build_session_id(interaction: Interaction) -> str:
-    guild_id = interaction.guild.id if interaction.guild else 0
+    guild_id = interaction.guild_id or 0
     ch = interaction.channel
     if ch is None:
         return f"guild:{guild_id}:channel:0:thread:0"
+    ch_id = getattr(ch, "id", 0)
     parent = getattr(ch, "parent", None)
-    channel_id = getattr(parent, "id", None) or getattr(ch, "id", 0)
-    thread_id = ch.id if parent is not None else 0
-    return f"guild:{guild_id}:channel:{channel_id}:thread:{thread_id or 0}"
+    if parent is None:
+        channel_id, thread_id = ch_id, 0
+    else:
+        channel_id, thread_id = getattr(parent, "id", None) or ch_id, ch_id
+    return f"guild:{guild_id}:channel:{channel_id}:thread:{thread_id}"
 
 
 @client.tree.command(
@@ -80,55 +89,54 @@ def _build_session_id(interaction: Interaction) -> str:
 @track_token_usage()
 @app_commands.rename(user_msg="message")
 async def ai_command(interaction: Interaction, user_msg: str) -> None:
+    t0 = time.perf_counter()
+    run_id: str | None = None
+    session_id: str | None = None
     try:
         run_id = str(uuid.uuid4())
         session_id = _build_session_id(interaction)
-        t0 = time.perf_counter()
 
         await interaction.response.defer()
 
         res = await generate_agents_response(user_msg)
         text = res.get("text", "") or "応答が空でした。"
-        meta = res.get("meta", {})
+        meta = res.get("meta")
+        if not isinstance(meta, dict):
+            meta = {}
 
         await _send_chunked(interaction, text)
 
         latency_ms = int((time.perf_counter() - t0) * 1000)
 
         # Normalize usage to a dict if possible
-        usage_val = (meta or {}).get("usage") if isinstance(meta, dict) else None
+        usage_val = meta.get("usage")
         if not isinstance(usage_val, dict):
             usage_val = None
 
-        async with get_session() as session:
-            await agent_runs_service.record_success(
-                session,
-                run_id=run_id,
-                session_id=session_id,
-                intent="ai",
-                agent_key=(meta or {}).get("agent_key") or "unknown",
-                model=(meta or {}).get("model"),
-                usage=usage_val,
-                latency_ms=latency_ms,
-                tool_calls=(meta or {}).get("tool_calls"),
-                handoffs=(meta or {}).get("handoffs"),
-                output_preview=text,
-            )
+        # The run log is written in batches by the background writer loop.
+        agent_run_writer.enqueue_success(
+            run_id=run_id,
+            session_id=session_id,
+            intent="ai",
+            agent_key=meta.get("agent_key") or "unknown",
+            model=meta.get("model"),
+            usage=usage_val,
+            latency_ms=latency_ms,
+            tool_calls=meta.get("tool_calls"),
+            handoffs=meta.get("handoffs"),
+            output_preview=text,
+        )
         interaction.extras[LLM_USAGE_EXTRA_KEY] = usage_val
     except Exception as e:
-        logger.exception("Error in /ai command: %s", e)
+        logger.exception("Error in /ai command")
         try:
             # Attempt to record failure metadata
-            latency_ms = int(
-                (time.perf_counter() - locals().get("t0", time.perf_counter())) * 1000,
-            )
-            run_id = locals().get("run_id", str(uuid.uuid4()))
-            session_id = locals().get("session_id", _build_session_id(interaction))
+            latency_ms = int((time.perf_counter() - t0) * 1000)
             async with get_session() as session:
                 await agent_runs_service.record_error(
                     session,
-                    run_id=run_id,
-                    session_id=session_id,
+                    run_id=run_id or str(uuid.uuid4()),
+                    session_id=session_id or _build_session_id(interaction),
                     intent="ai",
                     agent_key=None,
                     model=None,
@@ -1,9 +1,8 @@
 """/limit and /set-limit slash commands: daily token usage and limits."""
 
-import os
-
 from src.aibot.db.engine import get_session
 from src.aibot.discord import Colour, Embed, Interaction
+from src.aibot.discord.admin import admin_user_ids
 from src.aibot.discord.client import BotClient
 from src.aibot.discord.decorators.access import is_admin_user
 from src.aibot.logger import logger
@@ -19,9 +18,12 @@ client = BotClient.get_instance()
 @is_admin_user()
 async def set_limit_command(interaction: Interaction, limit: int) -> None:
     """Set the default daily token limit for each user (admin only)."""
+    # Acknowledge before touching the DB so a slow first query cannot miss
+    # Discord's 3-second response window.
+    await interaction.response.defer(ephemeral=True)
     try:
         if limit < 1:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "**limit**は1以上の整数を指定してください",
                 ephemeral=True,
             )
@@ -30,7 +32,7 @@ async def set_limit_command(interaction: Interaction, limit: int) -> None:
         async with get_session() as session:
             await usage_service.set_daily_token_limit(session, limit)
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"トークン上限を{limit}/dayに設定しました",
             ephemeral=True,
         )
@@ -40,7 +42,7 @@ async def set_limit_command(interaction: Interaction, limit: int) -> None:
             limit,
         )
     except Exception:
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "[ERROR] `/set-limit` コマンドでエラーが発生しました",
             ephemeral=True,
         )
@@ -53,13 +55,15 @@ async def set_limit_command(interaction: Interaction, limit: int) -> None:
 )
 async def limit_command(interaction: Interaction) -> None:
     """Check the user's limit and current usage."""
+    await interaction.response.defer(ephemeral=True)
     try:
         user = interaction.user
-        admin_ids: list[int] = [int(id_str) for id_str in os.environ["ADMIN_USER_IDS"].split(",")]
 
         async with get_session() as session:
-            user_limit = await usage_service.get_daily_token_limit(session, user.id)
-            current_usage = await usage_service.get_user_daily_token_usage(session, user.id)
+            user_limit, current_usage = await usage_service.get_limit_and_usage(
+                session,
+                user.id,
+            )
         total_tokens = current_usage["total_tokens"]
 
         embed = Embed(
@@ -68,7 +72,7 @@ async def limit_command(interaction: Interaction) -> None:
         )
 
         # Admin user is unlimited
-        if user.id in admin_ids:
+        if user.id in admin_user_ids():
             embed.add_field(name="使用トークン", value=f"{total_tokens} / ∞", inline=True)
             embed.add_field(name="残りトークン", value="∞", inline=True)
         else:
@@ -88,9 +92,9 @@ async def limit_command(interaction: Interaction) -> None:
             inline=True,
         )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
     except Exception:
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "[ERROR] 使用状況の取得に失敗しました",
             ephemeral=True,
         )
@@ -1,10 +1,10 @@
 """Access-control decorators for slash commands."""
 
-import os
 from collections.abc import Callable
 from typing import TypeVar
 
 from src.aibot.discord import Interaction, app_commands
+from src.aibot.discord.admin import admin_user_ids
 
 T = TypeVar("T")
 
@@ -20,6 +20,6 @@ def is_admin_user() -> Callable[[T], T]:
     """
 
     def predicate(interaction: Interaction) -> bool:
-        return interaction.user.id in [int(i) for i in os.environ["ADMIN_USER_IDS"].split(",")]
+        return interaction.user.id in admin_user_ids()
 
     return app_commands.check(predicate)
@@ -1,12 +1,12 @@
 """Token-usage decorators: daily-limit gating and post-run accounting."""
 
-import os
 from collections.abc import Awaitable, Callable, Mapping
 from functools import wraps
 from typing import Any, TypeVar, cast
 
 from src.aibot.db.engine import get_session
 from src.aibot.discord import Interaction, app_commands
+from src.aibot.discord.admin import admin_user_ids
 from src.aibot.logger import logger
 from src.aibot.services import usage as usage_service
 
@@ -15,10 +15,6 @@ T = TypeVar("T")
 LLM_USAGE_EXTRA_KEY = "llm_usage"
 
 
-def _admin_user_ids() -> list[int]:
-    return [int(i) for i in os.environ["ADMIN_USER_IDS"].split(",")]
-
-
 def _normalize_token_usage(value: object) -> dict[str, int] | None:
     if not isinstance(value, Mapping):
         return None
@@ -58,16 +54,12 @@ def has_daily_tokens_left() -> Callable[[T], T]:
 
     async def predicate(interaction: Interaction) -> bool:
         # Admin users bypass usage limits
-        if interaction.user.id in _admin_user_ids():
+        if interaction.user.id in admin_user_ids():
             return True
 
         # Check usage limits for regular users
         async with get_session() as session:
-            current_usage = await usage_service.get_user_daily_token_usage(
-                session,
-                interaction.user.id,
-            )
-            user_limit = await usage_service.get_daily_token_limit(
+            user_limit, current_usage = await usage_service.get_limit_and_usage(
                 session,
                 interaction.user.id,
             )
@@ -94,13 +86,12 @@ def track_token_usage(usage_key: str = LLM_USAGE_EXTRA_KEY) -> Callable[[T], T]:
     def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
         @wraps(func)
         async def wrapper(*args: object, **kwargs: object) -> object:
-            # Find the interaction parameter by iterating through all arguments
-            # Decorator can't assume the order or structure of function parameters
-            interaction = None
-            for arg in args:
-                if isinstance(arg, Interaction):
-                    interaction = arg
-                    break
+            # discord.py passes the Interaction first; fall back to scanning the
+            # arguments in case the decorated function is shaped differently.
+            if args and isinstance(args[0], Interaction):
+                interaction = args[0]
+            else:
+                interaction = next((arg for arg in args if isinstance(arg, Interaction)), None)
 
             if interaction is None:
                 logger.error("No Interaction found in command arguments for usage tracking")
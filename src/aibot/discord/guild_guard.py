@@ -5,6 +5,7 @@ guild listed in `ALLOWED_GUILD_IDS`. DMs (no guild) are always rejected.
 """
 
 import os
+from functools import cache
 
 from src.aibot.discord import Interaction, app_commands
 from src.aibot.logger import logger
@@ -12,10 +13,15 @@ from src.aibot.logger import logger
 _DENY_MESSAGE = "このサーバーでは利用できません。"
 
 
-def allowed_guild_ids() -> set[int]:
-    """Parse the approved guild IDs from the `ALLOWED_GUILD_IDS` env var."""
+@cache
+def allowed_guild_ids() -> frozenset[int]:
+    """Parse the approved guild IDs from the `ALLOWED_GUILD_IDS` env var.
+
+    Parsed on first use (after `__main__` has loaded `.env`) and cached, since
+    every slash command consults the allowlist.
+    """
     raw = os.getenv("ALLOWED_GUILD_IDS", "")
-    return {int(i) for i in raw.split(",") if i.strip()}
+    return frozenset(int(i) for i in raw.split(",") if i.strip())
 
 
 def is_guild_allowed(guild_id: int | None) -> bool:
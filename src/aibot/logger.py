@@ -1,11 +1,17 @@
 import argparse
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
 def _setup_logger(level: str) -> logging.Logger:
     """Set up a logger with the specified log level.
 
+    Records are handed to a background `QueueListener` thread, so callers on
+    the event loop never block on file or console writes.
+
     Parameters
     ----------
     level : str
@@ -38,16 +44,25 @@ def _setup_logger(level: str) -> logging.Logger:
     # create log folder if not exists
     Path("./logs").mkdir(exist_ok=True)
 
-    file_handler = logging.FileHandler(log_file)
-    stream_handler = logging.StreamHandler()
-
-    logging.basicConfig(
-        level=level,
+    formatter = logging.Formatter(
         # e.g. [2025-10-17 00:12:26 - target_file:496 - DEBUG] mesage
-        format="[%(asctime)s - %(name)s:%(lineno)d - %(levelname)s] %(message)s",
+        fmt="[%(asctime)s - %(name)s:%(lineno)d - %(levelname)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[file_handler, stream_handler],
     )
+    file_handler = logging.FileHandler(log_file)
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    # Drain whatever is still queued before the interpreter exits.
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(numeric_level)
+    root.addHandler(QueueHandler(log_queue))
 
     return logging.getLogger(__name__)
 
@@ -0,0 +1,114 @@
+"""Background writer that batches `/ai` run logs into shared transactions.
+
+Commands enqueue a finished run and return immediately; a single loop drains
+the queue and writes up to `_BATCH_MAX` runs per commit, so a burst of `/ai`
+calls costs one transaction instead of one per call.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+
+from src.aibot.db.engine import get_session
+from src.aibot.logger import logger
+from src.aibot.services import agent_runs as agent_runs_service
+
+_BATCH_MAX = 100
+_BATCH_WAIT_SECONDS = 2.0
+
+# `None` is the stop sentinel put by `stop()`.
+_queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+
+def enqueue_success(**kwargs: Any) -> None:  # noqa: ANN401
+    """Queue a successful run; takes the keyword arguments of `record_success`.
+
+    The run is timestamped here, since it may be written up to a batch
+    interval later.
+    """
+    kwargs.setdefault("created_at", datetime.now(UTC).replace(tzinfo=None))
+    _queue.put_nowait(kwargs)
+
+
+def stop() -> None:
+    """Ask the writer loop to write every run queued so far, then return."""
+    _queue.put_nowait(None)
+
+
+async def _fill_batch(batch: list[dict[str, Any]]) -> bool:
+    """Block for one run, then collect more until the batch is full or time is up.
+
+    Returns True once the stop sentinel has been taken off the queue.
+    """
+    item = await _queue.get()
+    if item is None:
+        return True
+    batch.append(item)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _BATCH_WAIT_SECONDS
+    while len(batch) < _BATCH_MAX:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            return False
+        try:
+            item = await asyncio.wait_for(_queue.get(), timeout)
+        except TimeoutError:
+            return False
+        if item is None:
+            return True
+        batch.append(item)
+    return False
+
+
+async def _write_one(kwargs: dict[str, Any]) -> None:
+    try:
+        async with get_session() as session:
+            await agent_runs_service.record_success(session, **kwargs)
+    except Exception:
+        logger.exception("Failed to write /ai run log %s", kwargs.get("run_id"))
+
+
+async def _write(batch: list[dict[str, Any]]) -> None:
+    try:
+        async with get_session() as session:
+            for kwargs in batch:
+                await agent_runs_service.record_success(session, **kwargs)
+    except Exception:
+        # One bad row rolls back the whole transaction; retry each run on its
+        # own so the others are still recorded.
+        logger.warning(
+            "Batched write of %d /ai run log(s) failed; retrying one by one",
+            len(batch),
+            exc_info=True,
+        )
+        for kwargs in batch:
+            await _write_one(kwargs)
+
+
+async def run_writer_loop() -> None:
+    """Write queued runs in batches until `stop()` is called."""
+    logger.info("Agent run writer loop started")
+    while True:
+        batch: list[dict[str, Any]] = []
+        try:
+            stopping = await _fill_batch(batch)
+        except asyncio.CancelledError:
+            # Do not drop runs that were already taken off the queue.
+            if batch:
+                await _write(batch)
+            raise
+        if batch:
+            await _write(batch)
+        if stopping:
+            return
+
+
+async def flush() -> None:
+    """Write every run still waiting in the queue (call once on shutdown)."""
+    batch: list[dict[str, Any]] = []
+    while not _queue.empty():
+        item = _queue.get_nowait()
+        if item is not None:
+            batch.append(item)
+    if batch:
+        await _write(batch)
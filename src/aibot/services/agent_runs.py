@@ -10,6 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.aibot.db.models.agent_run import AgentRun
 
 _OUTPUT_PREVIEW_MAX = 2000
+# Compact separators: the JSON columns are for storage, not for reading.
+_JSON_SEPARATORS = (",", ":")
 
 
 def _utc_now_naive() -> datetime:
@@ -30,13 +32,18 @@ async def record_success(  # noqa: PLR0913
     tool_calls: list[dict[str, Any]] | None = None,
     handoffs: list[dict[str, Any]] | None = None,
     output_preview: str | None = None,
+    created_at: datetime | None = None,
 ) -> None:
-    """Record a successful agent run."""
+    """Record a successful agent run.
+
+    `created_at` is when the run finished, as a naive UTC datetime; it defaults
+    to now, which is only accurate when the run is written immediately.
+    """
     usage = usage or {}
     run = AgentRun(
         run_id=run_id,
         session_id=session_id,
-        created_at=_utc_now_naive(),
+        created_at=created_at or _utc_now_naive(),
         intent=intent,
         agent_key=agent_key,
         model=model,
@@ -46,8 +53,8 @@ async def record_success(  # noqa: PLR0913
         latency_ms=latency_ms,
         status="succeeded",
         error=None,
-        tool_calls=json.dumps(tool_calls or []),
-        handoffs=json.dumps(handoffs or []),
+        tool_calls=json.dumps(tool_calls or [], separators=_JSON_SEPARATORS),
+        handoffs=json.dumps(handoffs or [], separators=_JSON_SEPARATORS),
         output_preview=(output_preview or "")[:_OUTPUT_PREVIEW_MAX],
     )
     session.add(run)
@@ -7,6 +7,7 @@ through `Runner.run`.
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
@@ -18,9 +19,25 @@ from src.aibot.logger import logger
 
 BASE_AGENT_NAME = "general"
 
+_USAGE_FIELDS = ("requests", "input_tokens", "output_tokens", "total_tokens")
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@cache
+def _parse_agents_config(cfg_path: Path) -> dict:
+    """Parse agents.yml once per process; a YAML error propagates and is not cached."""
+    with cfg_path.open("r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}  # noqa: S506
+
 
 def _load_agents_config() -> dict:
-    """Load resources/agents.yml configuration."""
+    """Load resources/agents.yml configuration.
+
+    A successful parse is reused for the life of the process. A missing or
+    invalid file is looked up again on the next call.
+    """
     curr = Path(__file__).resolve()
     cfg_path: Path | None = None
     for parent in curr.parents:
@@ -34,12 +51,11 @@ def _load_agents_config() -> dict:
         logger.warning("resources/agents.yml not found")
         return {}
 
-    with cfg_path.open("r", encoding="utf-8") as f:
-        try:
-            return yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            logger.warning("failed to parse %s: %s", cfg_path, e)
-            return {}
+    try:
+        return _parse_agents_config(cfg_path)
+    except yaml.YAMLError as e:
+        logger.warning("failed to parse %s: %s", cfg_path, e)
+        return {}
 
 
 def get_all_agents() -> list[Agent]:
@@ -78,19 +94,8 @@ def _extract_usage(result: object) -> dict[str, Any] | None:
         return None
 
     if isinstance(usage, dict):
-        return {
-            "requests": usage.get("requests", 0),
-            "input_tokens": usage.get("input_tokens", 0),
-            "output_tokens": usage.get("output_tokens", 0),
-            "total_tokens": usage.get("total_tokens", 0),
-        }
-
-    return {
-        "requests": getattr(usage, "requests", 0),
-        "input_tokens": getattr(usage, "input_tokens", 0),
-        "output_tokens": getattr(usage, "output_tokens", 0),
-        "total_tokens": getattr(usage, "total_tokens", 0),
-    }
+        return {field: usage.get(field, 0) for field in _USAGE_FIELDS}
+    return {field: getattr(usage, field, 0) for field in _USAGE_FIELDS}
 
 
 def _build_base_instructions(
@@ -134,29 +139,22 @@ def _extract_tool_calls(result: object) -> list[dict[str, str]]:
     return tool_calls
 
 
-async def generate_agents_response(user_msg: str) -> dict:
-    """Generate response using configured agents and return text + meta.
+class _NoAgentsConfiguredError(Exception):
+    """Raised when agents.yml defines no agents (or could not be loaded)."""
 
-    Returns
-    -------
-    dict
-        { "text": str, "meta": { "agent_key": str|None, "model": str|None,
-          "usage": dict|None, "tool_calls": list|None, "handoffs": list|None } }
 
+@cache
+def _build_base_agent() -> Agent:
+    """Build the base persona with every specialist attached as a tool.
+
+    Agents are immutable configuration, so the assembled agent is built once
+    and shared by every run. When no agents are configured this raises
+    instead of returning, so the failure is not cached and the next call
+    tries again.
     """
     agents = get_all_agents()
-
     if not agents:
-        return {
-            "text": "エージェントが設定されていません。resources/agents.yml を確認してください。",
-            "meta": {
-                "agent_key": None,
-                "model": None,
-                "usage": None,
-                "tool_calls": None,
-                "handoffs": None,
-            },
-        }
+        raise _NoAgentsConfiguredError
 
     base_agent = next((agent for agent in agents if agent.name == BASE_AGENT_NAME), agents[0])
     specialist_agents = [agent for agent in agents if agent.name != base_agent.name]
@@ -171,7 +169,7 @@ async def generate_agents_response(user_msg: str) -> dict:
     base_instructions = (
         base_agent.instructions if isinstance(base_agent.instructions, str) else None
     )
-    base_agent_with_tools = base_agent.clone(
+    return base_agent.clone(
         instructions=_build_base_instructions(
             base_instructions,
             has_specialist_tools=bool(specialist_tools),
@@ -179,25 +177,51 @@ async def generate_agents_response(user_msg: str) -> dict:
         tools=[*base_agent.tools, *specialist_tools],
     )
 
-    final_result = await Runner.run(base_agent_with_tools, input=user_msg)
+
+async def generate_agents_response(user_msg: str) -> dict:
+    """Generate response using configured agents and return text + meta.
+
+    Returns
+    -------
+    dict
+        { "text": str, "meta": { "agent_key": str|None, "model": str|None,
+          "usage": dict|None, "tool_calls": list|None, "handoffs": list|None } }
+
+    """
+    try:
+        base_agent = _build_base_agent()
+    except _NoAgentsConfiguredError:
+        return {
+            "text": "エージェントが設定されていません。resources/agents.yml を確認してください。",
+            "meta": {
+                "agent_key": None,
+                "model": None,
+                "usage": None,
+                "tool_calls": None,
+                "handoffs": None,
+            },
+        }
+
+    final_result = await Runner.run(base_agent, input=user_msg)
     text = _extract_text(final_result)
     tool_calls = _extract_tool_calls(final_result)
+    tool_names = [call["tool_name"] for call in tool_calls]
 
     return {
         "text": text,
         "meta": {
             "agent_key": base_agent.name,
-            "specialist_agent_key": ", ".join(call["tool_name"] for call in tool_calls) or None,
+            "specialist_agent_key": ", ".join(tool_names) or None,
             "model": str(base_agent.model) if base_agent.model is not None else None,
             "usage": _extract_usage(final_result),
             "tool_calls": tool_calls,
             "handoffs": [
                 {
                     "from": base_agent.name,
-                    "to": call["tool_name"],
+                    "to": tool_name,
                     "via": "tool",
                 }
-                for call in tool_calls
+                for tool_name in tool_names
             ],
         },
     }
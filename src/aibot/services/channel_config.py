@@ -1,5 +1,6 @@
 """Per-guild reminder channel configuration."""
 
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.aibot.db.models.channel_config import ChannelConfig
@@ -7,11 +8,13 @@ from src.aibot.db.models.channel_config import ChannelConfig
 
 async def set_channel(session: AsyncSession, guild_id: int, channel_id: int) -> None:
     """Set (or update) the reminder destination channel for a guild."""
-    config = await session.get(ChannelConfig, guild_id)
-    if config is None:
-        session.add(ChannelConfig(guild_id=guild_id, channel_id=channel_id))
-    else:
-        config.channel_id = channel_id
+    stmt = insert(ChannelConfig).values(guild_id=guild_id, channel_id=channel_id)
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ChannelConfig.guild_id],
+            set_={"channel_id": stmt.excluded.channel_id},
+        ),
+    )
 
 
 async def get_channel(session: AsyncSession, guild_id: int) -> int | None:
@@ -1,33 +1,46 @@
-"""Background loop that clears stale daily token usage at JST midnight."""
+"""Background loop that clears stale daily token usage at JST midnight.
+
+The same daily pass also runs SQLite maintenance, since the bot keeps its
+connections open for its whole lifetime.
+"""
 
-import asyncio
 from datetime import datetime, time, timedelta
 
-from src.aibot.db.engine import get_session
+from src.aibot.db.engine import get_session, optimize_db
 from src.aibot.logger import logger
 from src.aibot.services import usage as usage_service
+from src.aibot.services.scheduler import sleep_until
 from src.aibot.services.usage import JST
 
 _RESET_TIME = time(0, 0, 0)
 
 
-def _seconds_until(target: time) -> float:
-    """Seconds from now until the next occurrence of `target` in JST."""
+def _next_occurrence(target: time) -> datetime:
+    """The next occurrence of `target` in JST, strictly after now."""
     now = datetime.now(JST)
     next_run = datetime.combine(now.date(), target, tzinfo=JST)
     if now.time() >= target:
         next_run += timedelta(days=1)
-    return (next_run - now).total_seconds()
+    return next_run
 
 
 async def run_daily_reset_loop() -> None:
     """Run forever, deleting old usage records once per day at JST midnight."""
     logger.info("Daily usage reset loop started")
+    # JST has no DST, so every later run is normally one day after the last.
+    # After a suspend or downtime spanning days, resync to the next midnight
+    # instead of running the missed passes back to back.
+    next_run = _next_occurrence(_RESET_TIME)
     while True:
-        await asyncio.sleep(_seconds_until(_RESET_TIME))
+        await sleep_until(next_run)
+        next_run = max(next_run + timedelta(days=1), _next_occurrence(_RESET_TIME))
         try:
             async with get_session() as session:
                 removed = await usage_service.reset_old_usage(session)
             logger.info("Daily usage reset: removed %d old record(s)", removed)
         except Exception:
             logger.exception("Failed to reset daily usage")
+        try:
+            await optimize_db()
+        except Exception:
+            logger.exception("Failed to run daily database maintenance")
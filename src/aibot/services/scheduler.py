@@ -2,12 +2,28 @@
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from datetime import UTC, datetime
+from datetime import datetime
 
 from src.aibot.logger import logger
 
 FireCallback = Callable[[int], Awaitable[None]]
 
+# Upper bound on a single sleep, so a wall-clock step (NTP, suspend) while
+# waiting is noticed within this many seconds.
+_MAX_SLEEP_SECONDS = 600.0
+
+
+async def sleep_until(when: datetime) -> None:
+    """Sleep until the wall clock reaches `when` (an aware datetime).
+
+    `asyncio.sleep` runs on the loop's monotonic clock, so a long sleep drifts
+    from the wall clock whenever the system time is adjusted. Sleeping in
+    bounded slices and re-checking the target keeps the wake-up on time.
+    """
+    # Deliberate bounded polling: the wall clock is re-read after every slice.
+    while (remaining := (when - datetime.now(when.tzinfo)).total_seconds()) > 0:  # noqa: ASYNC110
+        await asyncio.sleep(min(remaining, _MAX_SLEEP_SECONDS))
+
 
 class Scheduler:
     """Schedules `on_fire(reminder_id)` calls. Knows nothing about Discord."""
@@ -32,9 +48,7 @@ class Scheduler:
             task.cancel()
 
     async def _wait_and_fire(self, reminder_id: int, when: datetime) -> None:
-        delay = (when - datetime.now(UTC)).total_seconds()
-        if delay > 0:
-            await asyncio.sleep(delay)
+        await sleep_until(when)
         try:
             await self._on_fire(reminder_id)
         except asyncio.CancelledError:
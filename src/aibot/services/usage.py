@@ -5,11 +5,14 @@ The day boundary is JST: a user's quota resets at midnight Japan time.
 
 import os
 from datetime import UTC, date, datetime, timedelta
+from functools import cache
 from typing import Any, cast
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import CursorResult, delete, select
+from sqlalchemy import ColumnElement, CursorResult, ScalarSelect, delete, func, select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from src.aibot.db.models.usage import DailyTokenUsage, UserTokenLimit
 
@@ -20,8 +23,9 @@ FALLBACK_DAILY_LIMIT = 100
 _DEFAULT_LIMIT_USER_ID = 0
 
 
+@cache
 def get_default_daily_limit() -> int:
-    """Default daily token limit from MAX_DAILY_USAGE (falls back to 100)."""
+    """Default daily token limit from MAX_DAILY_USAGE (falls back to 100, read once)."""
     raw = os.getenv("MAX_DAILY_USAGE")
     if raw is None:
         return FALLBACK_DAILY_LIMIT
@@ -42,58 +46,73 @@ async def set_daily_token_limit(
 ) -> None:
     """Set or update a daily token limit (default for all users when user_id is None)."""
     target_user_id = user_id if user_id is not None else _DEFAULT_LIMIT_USER_ID
-    now = datetime.now(UTC).replace(tzinfo=None)
-
-    row = await session.get(UserTokenLimit, target_user_id)
-    if row is None:
-        session.add(
-            UserTokenLimit(
-                user_id=target_user_id,
-                daily_token_limit=daily_token_limit,
-                last_updated=now,
-            ),
-        )
-    else:
-        row.daily_token_limit = daily_token_limit
-        row.last_updated = now
+    stmt = insert(UserTokenLimit).values(
+        user_id=target_user_id,
+        daily_token_limit=daily_token_limit,
+        last_updated=datetime.now(UTC).replace(tzinfo=None),
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserTokenLimit.user_id],
+            set_={
+                "daily_token_limit": stmt.excluded.daily_token_limit,
+                "last_updated": stmt.excluded.last_updated,
+            },
+        ),
+    )
 
 
-async def get_daily_token_limit(
-    session: AsyncSession,
-    user_id: int | None = None,
-) -> int:
-    """Return a user's limit, falling back to the default row then the env default."""
-    if user_id is not None:
-        row = await session.get(UserTokenLimit, user_id)
-        if row is not None:
-            return row.daily_token_limit
-
-    default_row = await session.get(UserTokenLimit, _DEFAULT_LIMIT_USER_ID)
-    if default_row is not None:
-        return default_row.daily_token_limit
-    return get_default_daily_limit()
-
-
-async def get_user_daily_token_usage(session: AsyncSession, user_id: int) -> dict[str, int]:
-    """Return today's (JST) usage for a user, zeroed when no record exists."""
-    row = await session.scalar(
-        select(DailyTokenUsage).where(
-            DailyTokenUsage.user_id == user_id,
-            DailyTokenUsage.usage_date == _today_jst(),
-        ),
+def _limit_subquery(user_id: int) -> ScalarSelect[int]:
+    return (
+        select(UserTokenLimit.daily_token_limit)
+        .where(UserTokenLimit.user_id == user_id)
+        .scalar_subquery()
     )
-    if row is None:
-        return {
-            "request_count": 0,
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "total_tokens": 0,
-        }
-    return {
-        "request_count": row.request_count,
-        "input_tokens": row.input_tokens,
-        "output_tokens": row.output_tokens,
-        "total_tokens": row.total_tokens,
+
+
+def _sum_or_zero(column: InstrumentedAttribute[int]) -> ColumnElement[int]:
+    return func.coalesce(func.sum(column), 0)
+
+
+async def get_limit_and_usage(
+    session: AsyncSession,
+    user_id: int,
+) -> tuple[int, dict[str, int]]:
+    """Return a user's daily limit and today's (JST) usage in one query.
+
+    The limit falls back from the user's own row to the default row (user_id 0)
+    and then to `get_default_daily_limit()`. The aggregate always yields exactly
+    one row; `(user_id, usage_date)` is unique, so each sum is that day's value
+    (or 0 when there is no record).
+    """
+    row = (
+        await session.execute(
+            select(
+                _limit_subquery(user_id),
+                _limit_subquery(_DEFAULT_LIMIT_USER_ID),
+                _sum_or_zero(DailyTokenUsage.request_count),
+                _sum_or_zero(DailyTokenUsage.input_tokens),
+                _sum_or_zero(DailyTokenUsage.output_tokens),
+                _sum_or_zero(DailyTokenUsage.total_tokens),
+            ).where(
+                DailyTokenUsage.user_id == user_id,
+                DailyTokenUsage.usage_date == _today_jst(),
+            ),
+        )
+    ).one()
+    user_limit, default_limit, request_count, input_tokens, output_tokens, total_tokens = row
+
+    if user_limit is not None:
+        limit = user_limit
+    elif default_limit is not None:
+        limit = default_limit
+    else:
+        limit = get_default_daily_limit()
+    return limit, {
+        "request_count": request_count,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": total_tokens,
     }
 
 
@@ -105,30 +124,30 @@ async def add_daily_token_usage(
     output_tokens: int,
     total_tokens: int,
 ) -> None:
-    """Add token usage to a user's record for today (JST), creating it if needed."""
-    today = _today_jst()
-    row = await session.scalar(
-        select(DailyTokenUsage).where(
-            DailyTokenUsage.user_id == user_id,
-            DailyTokenUsage.usage_date == today,
+    """Add token usage to a user's record for today (JST), creating it if needed.
+
+    A single upsert, so concurrent requests from the same user cannot race to
+    insert the day's row.
+    """
+    stmt = insert(DailyTokenUsage).values(
+        user_id=user_id,
+        usage_date=_today_jst(),
+        request_count=1,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        total_tokens=total_tokens,
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[DailyTokenUsage.user_id, DailyTokenUsage.usage_date],
+            set_={
+                "request_count": DailyTokenUsage.request_count + 1,
+                "input_tokens": DailyTokenUsage.input_tokens + stmt.excluded.input_tokens,
+                "output_tokens": DailyTokenUsage.output_tokens + stmt.excluded.output_tokens,
+                "total_tokens": DailyTokenUsage.total_tokens + stmt.excluded.total_tokens,
+            },
         ),
     )
-    if row is None:
-        session.add(
-            DailyTokenUsage(
-                user_id=user_id,
-                usage_date=today,
-                request_count=1,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
-            ),
-        )
-    else:
-        row.request_count += 1
-        row.input_tokens += input_tokens
-        row.output_tokens += output_tokens
-        row.total_tokens += total_tokens
 
 
 async def reset_old_usage(session: AsyncSession) -> int: